@@ -9,18 +9,26 @@ import uuid
 from datetime import datetime, timezone
 import numpy as np
 import pandas as pd
-from collections import defaultdict
 from tqdm import tqdm
 import tracemalloc
 import gc
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from data_structures.skip_list import SkipList
-from data_structures.linked_list import linkedList
 from data_structures.LAT import LAT
 from data_structures.hash_table import HashTable
 from data_structures.binary_search_tree import binarySearchTree
 from data_structures.array import Array
 from data_structures.radix_trie import RadixTrie
+from data_structures.sorted_map import SortedMap
+
+# Optional streaming Parquet output
+try:
+  import pyarrow as pa
+  import pyarrow.parquet as pq
+except ImportError:
+  pa = None
+  pq = None
 
 # Optional RSS (process) memory capture
 try:
@@ -39,6 +47,19 @@ def _rss_bytes():
     return None
     
 
+def _search_count(ds, keys):
+  # Every structure is timed through this same loop, with ds.search bound once,
+  # so the search column compares the structures rather than how they are called
+  search = ds.search
+  return sum(1 for key in keys if search(key) is not None)
+
+
+def _insert_count(ds, keys, values):
+  # ds.add bound once, not looked up per key
+  add = ds.add
+  return sum(1 for (k, v) in zip(keys, values) if not add(k, v))
+
+
 ### _______________ Config _______________ ###
 """
 Configuration for the benchmarks.
@@ -48,24 +69,40 @@ Configuration for the benchmarks.
 - operations: Dictionary of operations to test, with their corresponding functions.
 - DS_CLASSES: List of data structure classes to test.
 - SEARCH_TOTAL: Total number of search operations to perform per run and data size.
+- MEASURE_MEMORY: Capture tracemalloc/RSS metrics in a separate untimed pass. Set the
+  MEASURE_MEMORY env var to 0 for time-only runs (roughly halves wallclock).
+- WORKERS: Number of processes running (run, data_size) tasks in parallel. Defaults
+  to 1 (serial, lowest-noise timings); set the WORKERS env var to opt in. Memory
+  metrics are per worker process (tracemalloc and RSS are process-local).
 """
 
 BASE_SEED = 1121   
 RUNS = 50
 DATA_SIZES = [10_000, 25_000, 50_000, 100_000, 250_000, 500_000, 1_000_000]
 operations = {
-    'search': lambda ds, keys: sum(1 for k in keys if ds.search(k)),
+    'search': _search_count,
     'max':    lambda ds: ds.getMaxKey(),
     'min':    lambda ds: ds.getMinKey(),
-    'insert': lambda ds, keys, values: sum(1 for (k, v) in zip(keys, values) if not ds.add(k, v))
+    'insert': _insert_count
 }
-DS_CLASSES = [linkedList, HashTable, binarySearchTree, SkipList, LAT, RadixTrie]
+# SortedMap is the sorted-sequence baseline (bisect lookups over sorted keys, no
+# hashing), standing in for linkedList, whose O(n) walks dominated run time.
+# To benchmark it again, import linkedList from data_structures.linked_list and add it here.
+DS_CLASSES = [SortedMap, HashTable, binarySearchTree, SkipList, LAT, RadixTrie]
 
 # how many searches to run per (run, data_size)
 SEARCH_TOTAL = 500              # or None to use a fraction
 SEARCH_FRACTION = 0.1           # used if SEARCH_TOTAL is None
 SEARCH_MISS_RATIO = 0.5         # 50% misses, 50% hits
 
+MEASURE_MEMORY = os.environ.get("MEASURE_MEMORY", "1") != "0"
+
+# Worker processes; each (run, data_size) pair is one task. Serial by default:
+# parallel workers contend for cache and memory bandwidth, which skews timings,
+# and each holds its own data and structures in memory. Opt in with the WORKERS
+# env var (e.g. WORKERS=4) for faster, noisier runs.
+WORKERS = max(1, int(os.environ.get("WORKERS", "1")))
+
 # Total steps for progress bar
 TOTAL_STEPS = RUNS * len(DATA_SIZES) * len(DS_CLASSES) * (1 + len(operations))
 
@@ -87,8 +124,14 @@ def make_rngs_for_sizes(seed, data_sizes):
   }
 
 
-def generateData(rng, data_size):
-  return rng.integers(0, data_size, size=data_size, dtype=np.int64)
+def generateData(rng, data_size, rows=None):
+  """
+  Draws data_size ints in [0, data_size). With rows, draws a (rows, data_size)
+  block in one call; each row is a view into the single buffer, and the values
+  match rows consecutive single-row calls on the same rng.
+  """
+  size = data_size if rows is None else (rows, data_size)
+  return rng.integers(0, data_size, size=size, dtype=np.int64)
 
 
 def make_mixed_search_keys(existing_keys, rng, total=None, fraction=None, miss_ratio=0.5):
@@ -97,7 +140,7 @@ def make_mixed_search_keys(existing_keys, rng, total=None, fraction=None, miss_r
   and misses (random keys not in existing keys).
 
   Args:
-      existing_keys (list):  list of existing keys to sample from_
+      existing_keys (np.ndarray):  array of existing keys to sample from
       rng (_type_): random number generator instance
       total (int, optional): Number of total search keys to generate. Defaults to None.
       fraction (float, optional): fraction of search keys to generate if arg total not provided. Defaults to None.
@@ -118,15 +161,19 @@ def make_mixed_search_keys(existing_keys, rng, total=None, fraction=None, miss_r
   hit_idx = rng.choice(n, size=n_hit, replace=False)
   hit_keys = existing_keys[hit_idx]
 
-  # Misses: sample from a wider range and reject collisions
-  keyset = set(existing_keys)
-  misses = []
-  hi = max(keyset) + n + 1
-  while len(misses) < n_miss:
-      cand = int(rng.integers(0, hi))
-      if cand not in keyset:
-          misses.append(cand)
-  miss_keys = np.array(misses)
+  # Misses: sample batches from a wider range and reject collisions
+  sorted_keys = np.unique(existing_keys)
+  hi = int(sorted_keys[-1]) + n + 1
+  # A uniform draw collides with probability len(sorted_keys) / hi, so
+  # oversample by the inverse miss rate (+10%) to usually finish in one batch
+  oversample = 1.1 * hi / (hi - len(sorted_keys))
+  miss_keys = np.empty(0, dtype=np.int64)
+  while len(miss_keys) < n_miss:
+      need = n_miss - len(miss_keys)
+      cand = rng.integers(0, hi, size=int(need * oversample) + 1, dtype=np.int64)
+      pos = np.minimum(np.searchsorted(sorted_keys, cand), len(sorted_keys) - 1)
+      miss_keys = np.concatenate([miss_keys, cand[sorted_keys[pos] != cand]])
+  miss_keys = miss_keys[:n_miss]
 
   # Shuffle combined to avoid ordering bias
   combined = np.concatenate([hit_keys, miss_keys])
@@ -136,15 +183,50 @@ def make_mixed_search_keys(existing_keys, rng, total=None, fraction=None, miss_r
 
 ### _______________ Result Storage _______________ ###
 
-class TimeTestResults:
-  def __init__(self, data_structure, data_sizes):
-    self.data_structure = data_structure.__name__
-    self.results = {data_size: defaultdict(list) for data_size in data_sizes}
+OP_NAMES = ['creation', *operations]
+OP_INDEX = {op: i for i, op in enumerate(OP_NAMES)}
 
-result_objects = {
-    ds: TimeTestResults(ds, DATA_SIZES)
-    for ds in DS_CLASSES
-}
+class TimeTestResults:
+  """
+  Flat columnar result buffers with one row per measured call (TOTAL_STEPS rows).
+  Rows are laid out run-major as (run, data_size, data_structure, operation),
+  so every run fills one contiguous slab. The identity columns are known up
+  front; the metric columns are filled through store(). Memory columns are float64
+  so a missing metric can be stored as NaN.
+  """
+  def __init__(self, ds_classes, data_sizes, op_names, runs):
+    self.ds_names = [ds.__name__ for ds in ds_classes]
+    self.data_sizes = list(data_sizes)
+    self.op_names = list(op_names)
+    n_ds, n_sizes, n_ops = len(self.ds_names), len(self.data_sizes), len(self.op_names)
+    self.rows_per_run = n_sizes * n_ds * n_ops
+    n = runs * self.rows_per_run
+
+    self.run_index = np.repeat(np.arange(1, runs + 1), self.rows_per_run)
+    self.data_size = np.tile(np.repeat(self.data_sizes, n_ds * n_ops), runs)
+    self.ds_codes = np.tile(np.repeat(np.arange(n_ds), n_ops), runs * n_sizes)
+    self.op_codes = np.tile(np.arange(n_ops), runs * n_sizes * n_ds)
+
+    self.time_ns = np.zeros(n, dtype=np.int64)
+    self.mem_peak_b = np.full(n, np.nan)
+    self.rss_delta_b = np.full(n, np.nan)
+    self.rss_baseline_b = np.full(n, np.nan)  # set for 'creation' only
+
+  def row(self, r, size_idx, ds_idx, op_idx):
+    """ Flat row index of (run r, size, structure, operation). """
+    n_ops = len(self.op_names)
+    return ((r - 1) * self.rows_per_run
+            + (size_idx * len(self.ds_names) + ds_idx) * n_ops
+            + op_idx)
+
+  def store(self, r, size_idx, slab):
+    """ Copies the metric columns returned by runTests(r, size_idx) into place. """
+    start = self.row(r, size_idx, 0, 0)
+    rows = slice(start, start + len(slab["time_ns"]))
+    for col, values in slab.items():
+      getattr(self, col)[rows] = values
+
+results = TimeTestResults(DS_CLASSES, DATA_SIZES, OP_NAMES, RUNS)
 
 
 ### _______________ Error Handling _______________ ###
@@ -161,33 +243,50 @@ if any(not isinstance(ds, type) for ds in DS_CLASSES):
 
 ### _______________ Test Execution _______________ ###
 
-def measure_time_and_memory(fn, *args, **kwargs):
+def measure_time(fn, *args, _now=time.perf_counter_ns, **kwargs):
+  """
+  Runs fn(*args, **kwargs) and returns (time_ns, return_value).
+  Nothing else runs between the two clock reads; tracemalloc must be
+  stopped so its allocation hooks stay out of the timed region, and the
+  cyclic GC is paused so collections don't land in it either.
+  The underscore default binds the clock as a local (no global lookup).
+  """
+  gc_was_enabled = gc.isenabled()
+  gc.disable()
+  try:
+    start = _now()
+    ret = fn(*args, **kwargs)
+    end = _now()
+  finally:
+    if gc_was_enabled:
+      gc.enable()
+  return int(end - start), ret
+
+
+def measure_memory(fn, *args, _reset=tracemalloc.reset_peak,
+                   _traced=tracemalloc.get_traced_memory, _rss=_rss_bytes, **kwargs):
   """
-  Runs fn(*args, **kwargs) and returns (metrics, return_value).
+  Runs fn(*args, **kwargs) under tracemalloc and returns (metrics, return_value).
+  The call is not timed; timings come from a separate measure_time pass.
 
   metrics:
-    - time_ns:      int
     - mem_peak_b:   int           (tracemalloc peak during the call)
     - rss_delta_b:  Optional[int] (rss_after - rss_before)
     - rss_after_B:  Optional[int] (used only to set rss_baseline_b on creation)
   """
+  rss_before = _rss()
+  _reset()
 
-  rss_before = _rss_bytes()
-  tracemalloc.reset_peak()
-  
-  start = time.perf_counter_ns()
   ret = fn(*args, **kwargs)
-  end = time.perf_counter_ns()
-  
-  _, peak = tracemalloc.get_traced_memory()
 
-  rss_after = _rss_bytes()
+  _, peak = _traced()
+
+  rss_after = _rss()
   rss_delta = None
   if rss_before is not None and rss_after is not None:
     rss_delta = int(rss_after - rss_before)
 
   metrics = {
-    "time_ns": int(end - start),
     "mem_peak_b": int(peak),
     "rss_delta_b": rss_delta,
     "rss_after_B": int(rss_after) if rss_after is not None else None,
@@ -195,132 +294,195 @@ def measure_time_and_memory(fn, *args, **kwargs):
   return metrics, ret
 
 
-
-def runTests(DS_CLASSES, r, pbar): 
+def runTests(r, size_idx):
   """
-  Runs the benchmarks for each data structure class and data size.
+  Runs the benchmarks for every data structure class at one data size.
+  Each structure is exercised twice: a time-only pass with tracemalloc
+  stopped, then (if MEASURE_MEMORY) an untimed pass on a fresh instance
+  that records memory metrics.
+  Touches no shared state, so it can run in a worker process.
 
   Args:
-      DS_CLASSES (list): list of data structure classes to test
       r (int): run number
-      pbar (class: tqdm): progress bar object for tracking progress
+      size_idx (int): index into DATA_SIZES
+
+  Returns:
+      slab (dict): metric columns for the len(DS_CLASSES) * len(OP_NAMES)
+                   rows of this (run, size), in TimeTestResults row order
   """
   gc.collect() 
-  rngs_by_size = make_rngs_for_sizes(BASE_SEED + r, DATA_SIZES)
-
-  for data_size in DATA_SIZES:
-    rng_size = rngs_by_size[data_size]
-
-    value_sets = generateData(rng_size, data_size)
-    key_sets = generateData(rng_size, data_size)
-    insert_values = generateData(rng_size, min((data_size // 4), 10_000))
-    insert_keys = generateData(rng_size, min((data_size // 4), 10_000))
-
-    search_keys = make_mixed_search_keys(
-            key_sets, rng_size,
-            total=SEARCH_TOTAL if SEARCH_TOTAL is not None else None,
-            fraction=None if SEARCH_TOTAL is not None else SEARCH_FRACTION,
-            miss_ratio=SEARCH_MISS_RATIO
-        )
-
-    for ds in DS_CLASSES :
-
-      # Creation
-      metrics, structure = measure_time_and_memory(ds, key_sets, value_sets)
-
-      result_objects[ds].results[data_size]['creation'].append({
-        "run_index": r,
-        "time_ns": metrics["time_ns"],
-        "mem_peak_b": metrics["mem_peak_b"],
-        "rss_delta_b": metrics["rss_delta_b"],\
-        "rss_baseline_b": metrics["rss_after_B"]
-      })
-      pbar.update(1)
-
-      # Other operations
-      for operation, func in operations.items():
-        if operation == 'insert':
-           metrics, _ = measure_time_and_memory(func, structure, insert_keys, insert_values)
-        elif operation == 'search':
-          metrics, _ = measure_time_and_memory(func, structure, search_keys)
-        else:
-           metrics, _ = measure_time_and_memory(func, structure)
-          
-        result_objects[ds].results[data_size][operation].append({
-          "run_index": r,
-          "time_ns": metrics["time_ns"],
-          "mem_peak_b": metrics["mem_peak_b"],
-          "rss_delta_b": metrics["rss_delta_b"]
-        })
-        pbar.update(1)
-
-
-
-def run_benchmarks():
-  tracemalloc.start()
-  progress_bar = tqdm(total=TOTAL_STEPS, ncols=100)
-  try:
-    for r in range(1, RUNS + 1):
-      runTests(DS_CLASSES, r, progress_bar)
-  finally:
-    progress_bar.close()
-    tracemalloc.stop()
-
-
+  data_size = DATA_SIZES[size_idx]
+  rng_size = make_rngs_for_sizes(BASE_SEED + r, DATA_SIZES)[data_size]
+
+  value_sets, key_sets = generateData(rng_size, data_size, rows=2)
+  insert_values, insert_keys = generateData(rng_size, min((data_size // 4), 10_000), rows=2)
+
+  search_keys = make_mixed_search_keys(
+          key_sets, rng_size,
+          total=SEARCH_TOTAL if SEARCH_TOTAL is not None else None,
+          fraction=None if SEARCH_TOTAL is not None else SEARCH_FRACTION,
+          miss_ratio=SEARCH_MISS_RATIO
+      )
+
+  # Python lists: iterating an ndarray yields boxed numpy scalars, which
+  # hash/compare slower than ints and would end up stored in every node
+  key_list = key_sets.tolist()
+  value_list = value_sets.tolist()
+  op_args = {
+    'search': (search_keys.tolist(),),
+    'insert': (insert_keys.tolist(), insert_values.tolist()),
+  }
+  # The lists are all that's used from here on; free the array buffers
+  del value_sets, key_sets, insert_values, insert_keys, search_keys
+
+  n_rows = len(DS_CLASSES) * len(OP_NAMES)
+  slab = {
+    "time_ns": np.zeros(n_rows, dtype=np.int64),
+    "mem_peak_b": np.full(n_rows, np.nan),
+    "rss_delta_b": np.full(n_rows, np.nan),
+    "rss_baseline_b": np.full(n_rows, np.nan),
+  }
 
-def results_to_df(result_objects, run_id, seed):
-  rows = []
-  ts = datetime.now(timezone.utc).isoformat()
+  for ds_idx, ds in enumerate(DS_CLASSES):
 
-  for cls, res in result_objects.items():
-    ds_name = cls.__name__
-    for data_size, ops in res.results.items():
-      for op_name, entries in ops.items():
-        for trial_idx, rec in enumerate(entries):
-            ns = int(rec["time_ns"])
-            rows.append({
-                "run_id": run_id,
-                "timestamp_utc": ts,
-                "seed": seed,
-                "run_index": int(rec["run_index"]),
-                "data_structure": ds_name,
-                "operation": op_name,
-                "data_size": int(data_size),
-                "trial": trial_idx,
-              ## --- Time Fields --- ##
-                "time_ns": ns,
-                "time_s": ns / 1e9,
-              ## --- Memory Fields --- ##
-                "mem_peak_b": int(rec.get("mem_peak_b", 0)),
-                "rss_delta_b": rec.get("rss_delta_b"),
-                "rss_baseline_b": rec.get("rss_baseline_b")
-            })
-  return pd.DataFrame(rows)
-
-run_benchmarks()
+    structure = None
+    try:
+      # Time pass
+      times = {}
+      times['creation'], structure = measure_time(ds, key_list, value_list)
+      for operation, func in operations.items():
+        times[operation], _ = measure_time(func, structure, *op_args.get(operation, ()))
+      structure = None
+
+      # Memory pass
+      mems = {}
+      if MEASURE_MEMORY:
+        gc.collect()
+        tracemalloc.start()
+        try:
+          mems['creation'], structure = measure_memory(ds, key_list, value_list)
+          for operation, func in operations.items():
+            mems[operation], _ = measure_memory(func, structure, *op_args.get(operation, ()))
+        finally:
+          tracemalloc.stop()
+    finally:
+      # Drop this structure before the next build
+      structure = None
+      gc.collect()
+
+    for operation, time_ns in times.items():
+      i = ds_idx * len(OP_NAMES) + OP_INDEX[operation]
+      slab["time_ns"][i] = time_ns
+      if operation in mems:
+        metrics = mems[operation]
+        slab["mem_peak_b"][i] = metrics["mem_peak_b"]
+        slab["rss_delta_b"][i] = metrics["rss_delta_b"]
+        if operation == 'creation':
+          slab["rss_baseline_b"][i] = metrics["rss_after_B"]
+
+  return slab
+
+
+
+def results_to_df(results, run_id, seed, ts, r=None):
+  """
+  Builds a typed DataFrame from the result columns.
+  If r is given, only that run's slab of rows is included.
+  """
+  rows = slice(None)
+  if r is not None:
+    rows = slice((r - 1) * results.rows_per_run, r * results.rows_per_run)
+  run_index = results.run_index[rows]
+  time_ns = results.time_ns[rows]
+  return pd.DataFrame({
+      "run_id": run_id,
+      "timestamp_utc": ts,
+      "seed": seed,
+      "run_index": run_index,
+      "data_structure": pd.Categorical.from_codes(results.ds_codes[rows], categories=results.ds_names),
+      "operation": pd.Categorical.from_codes(results.op_codes[rows], categories=results.op_names),
+      "data_size": results.data_size[rows].astype(np.int32),
+      "trial": (run_index - 1).astype(np.int32),
+    ## --- Time Fields --- ##
+      "time_ns": time_ns,
+      "time_s": (time_ns / 1e9).astype(np.float32),
+    ## --- Memory Fields --- ##
+      "mem_peak_b": pd.array(results.mem_peak_b[rows], dtype="Int64"),
+      "rss_delta_b": pd.array(results.rss_delta_b[rows], dtype="Int64"),
+      "rss_baseline_b": pd.array(results.rss_baseline_b[rows], dtype="Int64")
+  })
 
 
 ### ------------ Results Data Processing/Storgae ----------- ###
 
-os.makedirs("benchmark_results", exist_ok=True)
-final_df = results_to_df(result_objects, run_id, BASE_SEED)
+class ResultWriter:
+  """
+  Appends result slabs to <path>.csv and streams them into <path>.parquet
+  as row groups, so no file is rewritten and the full result set is never
+  held as one DataFrame.
+  """
+  def __init__(self, path):
+    self.csv_path = f"{path}.csv"
+    self.parquet_path = f"{path}.parquet"
+    self._parquet = None
+    self._csv_header = True
+    if pq is None:
+      print("Parquet output disabled (install pyarrow).")
+
+  def write(self, df):
+    df.to_csv(self.csv_path, mode="a", header=self._csv_header, index=False)
+    self._csv_header = False
+    if pq is None:
+      return
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if self._parquet is None:
+      self._parquet = pq.ParquetWriter(self.parquet_path, table.schema)
+    self._parquet.write_table(table)
+
+  def close(self):
+    if self._parquet is not None:
+      self._parquet.close()
+      self._parquet = None
 
-final_df["data_structure"] = final_df["data_structure"].astype("category")
-final_df["operation"] = final_df["operation"].astype("category")
-final_df["data_size"] = final_df["data_size"].astype("int32")
-final_df["trial"] = final_df["trial"].astype("int32")
-final_df["time_s"] = final_df["time_s"].astype("float32")
-final_df["time_ns"] = final_df["time_ns"].astype("int64")
-final_df["mem_peak_b"] = final_df["mem_peak_b"].astype("int64")
-final_df["rss_delta_b"] = final_df["rss_delta_b"].astype("Int64")
-final_df["rss_baseline_b"] = final_df["rss_baseline_b"].astype("Int64")
 
-try:
-  final_df.to_parquet(f"benchmark_results/{run_id}.parquet", index=False)
-except Exception as e:
-  print("Parquet save failed (install pyarrow or fastparquet). Error:", e)
+def run_benchmarks():
+  """
+  Runs every (run, data size) task, in WORKERS processes when WORKERS > 1,
+  and writes each run to disk as soon as all of its sizes are done.
+  """
+  os.makedirs("benchmark_results", exist_ok=True)
+  ts = datetime.now(timezone.utc).isoformat()
+  writer = ResultWriter(f"benchmark_results/{run_id}")
+  tasks = [(r, size_idx) for r in range(1, RUNS + 1) for size_idx in range(len(DATA_SIZES))]
+  sizes_left = {r: len(DATA_SIZES) for r in range(1, RUNS + 1)}
+  steps_per_task = len(DS_CLASSES) * len(OP_NAMES)
+  progress_bar = tqdm(total=TOTAL_STEPS, ncols=100)
 
-final_df.to_csv(f"benchmark_results/{run_id}.csv", index=False)
+  def finish(r, size_idx, slab):
+    results.store(r, size_idx, slab)
+    progress_bar.update(steps_per_task)
+    sizes_left[r] -= 1
+    if sizes_left[r] == 0:
+      writer.write(results_to_df(results, run_id, BASE_SEED, ts, r))
 
+  try:
+    if WORKERS > 1:
+      with ProcessPoolExecutor(max_workers=WORKERS) as pool:
+        futures = {pool.submit(runTests, r, size_idx): (r, size_idx) for r, size_idx in tasks}
+        try:
+          for future in as_completed(futures):
+            finish(*futures[future], future.result())
+        except BaseException:
+          # Fail fast: drop queued tasks instead of running them all first
+          pool.shutdown(wait=False, cancel_futures=True)
+          raise
+    else:
+      for r, size_idx in tasks:
+        finish(r, size_idx, runTests(r, size_idx))
+  finally:
+    progress_bar.close()
+    writer.close()
 
 
+if __name__ == "__main__":
+  run_benchmarks()
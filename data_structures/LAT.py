@@ -34,47 +34,55 @@ class LAT:
       # radix, height = self.recommend_lat_config(keys)
       radix = 4
       height = 4
+    # Round radix up to a power of two so digits come from masks and shifts
+    radix = 1 << (radix - 1).bit_length()
     self.radix = radix
     self.height = height
+    self._mask = radix - 1
+    self._shift = radix.bit_length() - 1
+    # Right-shift that brings each level's digit down, most significant first
+    self._digit_shifts = tuple(self._shift * i for i in range(height - 1, -1, -1))
     self.root = IndexNode(radix, height, current_level=0)
     self.node_id = 0
+    if hasattr(keys, 'tolist'):
+      keys = keys.tolist()
     for key, val in zip(keys, values):
       self.add(key, val)
 
   def key_conversion(self, key):
-    stack = []
-    for _ in range(self.height):
-      stack.append(key % self.radix)
-      key = key // self.radix
-    return stack[::-1]  # most significant digit first
+    path = [0] * self.height
+    mask = self._mask
+    shift = self._shift
+    for i in range(self.height - 1, -1, -1):
+      path[i] = key & mask  # most significant digit first
+      key >>= shift
+    return path
 
   def add(self, key, value):
-    path = self.key_conversion(key)
+    # Digits are extracted inline (see _digit_shifts) to skip building a path list
     node = self.root
-
-    for level, digit in enumerate(path):
-      # At the leaf level
-      if level == self.height - 1:
-        if digit not in node.pointers:
-          node.pointers[digit] = LATLeafNode()
-        node.pointers[digit].add(key, value)
-      else:
-        if digit not in node.pointers:
-          node.pointers[digit] = IndexNode(self.radix, self.height, level + 1)
-        node = node.pointers[digit]
+    mask = self._mask
+    last = self.height - 1
+    for level, s in enumerate(self._digit_shifts):
+      digit = (key >> s) & mask
+      child = node.pointers[digit]
+      if child is None:
+        if level == last:
+          child = LATLeafNode()
+        else:
+          child = IndexNode(self.radix, self.height, level + 1)
+        node.pointers[digit] = child
+      node = child
+    node.add(key, value)
 
   def search(self, key):
-    path = self.key_conversion(key)
     node = self.root
-
-    for digit in path:
-      if digit not in node.pointers:
+    mask = self._mask
+    for s in self._digit_shifts:
+      node = node.pointers[(key >> s) & mask]
+      if node is None:
         return None
-      node = node.pointers[digit]
-
-    if isinstance(node, LATLeafNode):
-      return node.data.get(key)
-    return None
+    return node.data.get(key)
 
   def print_all(self):
     """ Debug: Print all key-value pairs in the LAT. """
@@ -84,8 +92,9 @@ class LAT:
         for k, v in node.data.items():
           print(f"Key: {k}, Value: {v}, Path: {path}")
       elif isinstance(node, IndexNode):
-        for digit, child in node.pointers.items():
-          dfs(child, path + [digit])
+        for digit, child in enumerate(node.pointers):
+          if child is not None:
+            dfs(child, path + [digit])
 
     dfs(self.root, [])
 
@@ -93,12 +102,12 @@ class LAT:
   def getMinKey(self):
     curr = self.root
     while not isinstance(curr, LATLeafNode):
-      curr = curr.pointers[min(curr.pointers.keys())]
+      curr = next(p for p in curr.pointers if p is not None)
     return min(curr.data.keys())
     
 
   def getMaxKey(self):
     curr = self.root
     while not isinstance(curr, LATLeafNode):
-      curr = curr.pointers[max(curr.pointers.keys())]
+      curr = next(p for p in reversed(curr.pointers) if p is not None)
     return max(curr.data.keys())
\ No newline at end of file
@@ -1,17 +1,29 @@
 """
 A module for creating and modifying arrays. Used as the control for testing purposes
 """
+from bisect import bisect_left, bisect_right
+import numpy as np
 
 class Array:
   def __init__(self, keys, values):
-    self.keys, self.values = zip(*sorted(zip(keys, values)))
-    self.keys = list(self.keys)
-    self.values = list(self.values)
+    # Stable sort order of the keys; kept as lists so add() can insert without
+    # copying. Integer arrays are sorted in C, any other keys by Python
+    # comparison so nothing is coerced or truncated.
+    if isinstance(keys, np.ndarray) and keys.dtype.kind in 'iu':
+      order = np.argsort(keys, kind='stable').tolist()
+      keys = keys.tolist()
+    else:
+      keys = list(keys)
+      order = sorted(range(len(keys)), key=keys.__getitem__)
+    self.keys = [keys[i] for i in order]
+    # Values are gathered from the original sequence so their types are kept
+    vals = list(values)
+    self.values = [vals[i] for i in order]
 
   def search(self, key):
-    for i, k in enumerate(self.keys):
-      if k == key:
-        return self.values[i]
+    i = bisect_left(self.keys, key)
+    if i < len(self.keys) and self.keys[i] == key:
+      return self.values[i]
     return None
 
   def getMaxKey(self):
@@ -21,38 +33,21 @@ class Array:
     return self.keys[0]
 
   def add(self, key, value):
-    for i, k in enumerate(self.keys):
-      if k > key:
-        self.keys.insert(i, key)
-        self.values.insert(i, value)
-        return
-      if k == key:
-        return
+    i = bisect_left(self.keys, key)
+    if i < len(self.keys) and self.keys[i] == key:
+      return
+    self.keys.insert(i, key)
+    self.values.insert(i, value)
 
   def update(self, key, value):
-    for i, k in enumerate(self.keys):
-      if k == key:
-        self.values[i] = value
-        return
-      if k > key:
-        return
+    i = bisect_left(self.keys, key)
+    if i < len(self.keys) and self.keys[i] == key:
+      self.values[i] = value
 
   def rangeQuery(self, start_key, end_key):
-    start_index = end_index = None
-    for i, k in enumerate(self.keys):
-      if k == start_key:
-        start_index = i
-      elif not start_index and k > start_key:
-        start_index = i
-      if k == end_key:
-        end_index = i
-        break
-      elif k > end_key:
-        end_index = i - 1
-        break
-    if start_index is None or end_index is None:
-      return None
-    return self.values[start_index:end_index+1]
+    lo = bisect_left(self.keys, start_key)
+    hi = bisect_right(self.keys, end_key)
+    return self.values[lo:hi]
   
   def nth_largest_key(self, n):
     if n <= 0 or n > len(self.keys):
@@ -1,9 +1,82 @@
 """
 Module for creating and modifying binary search trees.
 """
+from operator import itemgetter
 from data_structures.node_classes import bstNode
 
 
+# AVL helpers are module-level functions rather than methods: no bound-method
+# creation or self argument on the rebalance path, which runs per tree level.
+
+_MAX_DEPTH = 64
+
+
+def _h(node):
+  return node.height if node else 0
+
+
+def _rotateLeft(node):
+  x = node.right
+  y = x.left
+  x.left = node
+  node.right = y
+  lh, rh = _h(node.left), _h(y)
+  node.height = 1 + (lh if lh > rh else rh)
+  lh, rh = node.height, _h(x.right)
+  x.height = 1 + (lh if lh > rh else rh)
+  return x
+
+
+def _rotateRight(node):
+  x = node.left
+  y = x.right
+  x.right = node
+  node.left = y
+  lh, rh = _h(y), _h(node.right)
+  node.height = 1 + (lh if lh > rh else rh)
+  lh, rh = _h(x.left), node.height
+  x.height = 1 + (lh if lh > rh else rh)
+  return x
+
+
+def _rebalance(node):
+  lh = _h(node.left)
+  rh = _h(node.right)
+  node.height = 1 + (lh if lh > rh else rh)
+  balance = lh - rh
+
+  # Left heavy
+  if balance > 1:
+      child = node.left
+      if _h(child.left) < _h(child.right):  # Left-Right
+          node.left = _rotateLeft(child)
+      return _rotateRight(node)
+
+  # Right heavy
+  if balance < -1:
+      child = node.right
+      if _h(child.left) > _h(child.right):  # Right-Left
+          node.right = _rotateRight(child)
+      return _rotateLeft(node)
+  return node
+
+
+def _buildBalanced(keys, values, lo, hi):
+  """
+  Builds a height-balanced subtree from the strictly increasing keys[lo:hi]
+  by recursing on midpoints. Satisfies AVL without any rotations.
+  """
+  if lo >= hi:
+    return None
+  mid = (lo + hi) // 2
+  node = bstNode(keys[mid], values[mid])
+  node.left = _buildBalanced(keys, values, lo, mid)
+  node.right = _buildBalanced(keys, values, mid + 1, hi)
+  lh, rh = _h(node.left), _h(node.right)
+  node.height = 1 + (lh if lh > rh else rh)
+  return node
+
+
 class binarySearchTree:
   """
   Binary Search Tree Class.
@@ -17,64 +90,28 @@ class binarySearchTree:
 
 
   def __init__(self, keys, values):
-    self.root = None
-    for key, val in zip(keys, values):
-      self.add(key, val)
-
-  def __rotateLeft(self, node):
-    x = node.right
-    y = x.left
-    x.left = node
-    node.right = y
-    node.height = 1 + max(self.__getHeight(node))
-    x.height = 1 + max(self.__getHeight(x))
-    return x
-    
-
-  def __rotateRight(self, node):
-    x = node.left
-    y = x.right
-    x.right = node
-    node.left = y
-    node.height = 1 + max(self.__getHeight(node))
-    x.height = 1 + max(self.__getHeight(x))
-    return x
-
-  def __getHeight(self, node):
-    left_height = node.left.height if node.left else 0
-    right_height = node.right.height if node.right else 0
-    return [left_height, right_height]
-
-  def __getBalance(self, node):
-    left, right = self.__getHeight(node)
-    return left - right
-
-  
-  def __rebalance(self, node):
-    node.height = 1 + max(self.__getHeight(node))
-    balance = self.__getBalance(node)
-
-    # Left heavy
-    if balance > 1:
-        if self.__getBalance(node.left) < 0:  # Left-Right
-            node.left = self.__rotateLeft(node.left)
-        return self.__rotateRight(node)
-
-    # Right heavy
-    if balance < -1:
-        if self.__getBalance(node.right) > 0:  # Right-Left
-            node.right = self.__rotateRight(node.right)
-        return self.__rotateLeft(node)
-    return node
-
-
-  def __step(self, key, node):
-    if node.key == key:
-      return node
-    elif node.key > key:
-      return node.left
-    else:
-      return node.right
+    if hasattr(keys, 'tolist'):
+      keys = keys.tolist()
+    if hasattr(values, 'tolist'):
+      values = values.tolist()
+    # Sort once and build balanced in O(n) instead of n AVL inserts.
+    # The sort is stable on key only, so the first value given for a
+    # duplicate key wins, as it would with repeated add() calls.
+    sorted_keys = []
+    sorted_values = []
+    for key, val in sorted(zip(keys, values), key=itemgetter(0)):
+      if not sorted_keys or sorted_keys[-1] != key:
+        sorted_keys.append(key)
+        sorted_values.append(val)
+    # Reused descent stack for add(); AVL depth stays far below this
+    self._path = [None] * _MAX_DEPTH
+    self._build(sorted_keys, sorted_values)
+
+  def _build(self, keys, values):
+    self.root = _buildBalanced(keys, values, 0, len(keys))
+    # Extremes are cached so getMinKey/getMaxKey are O(1)
+    self._min_key = keys[0] if len(keys) else None
+    self._max_key = keys[-1] if len(keys) else None
 
   
   def __str__(self):
@@ -88,70 +125,72 @@ class binarySearchTree:
           2
               1
     """
-
-    def __print_tree(node, level=0):
-      if not node:
-        return ""
-      res = ""
-      res += __print_tree(node.right, level + 1)
-      res += " " * 4 * level + f"{node.key}\n"
-      res += __print_tree(node.left, level + 1)
-      return res
-
-    return __print_tree(self.root)
+    # Reverse in-order walk with an explicit stack, so deep trees
+    # cannot hit the recursion limit
+    lines = []
+    stack = []
+    node, level = self.root, 0
+    while stack or node:
+      while node:
+        stack.append((node, level))
+        node, level = node.right, level + 1
+      node, level = stack.pop()
+      lines.append(" " * 4 * level + f"{node.key}\n")
+      node, level = node.left, level + 1
+    return "".join(lines)
 
   def search(self, key):
     node = self.root
-    while node.key != key:
-      node = self.__step(key, node)
-      if not node:
-        return None
-    return node
+    while node:
+      node_key = node.key
+      if node_key == key:
+        return node
+      node = node.left if key < node_key else node.right
+    return None
 
   def add(self, key, value):
-    traversed = []
+    path = self._path
+    depth = 0
+    # Bit d is set when the descent went left from path[d]
+    went_left = 0
     node = self.root
-    parent = None
 
     while node:
-        if key == node.key:
+        node_key = node.key
+        if key == node_key:
             # print(f"Value {value} already exists.")
             return
-        traversed.append(node)
-        parent = node
-        if key < node.key:
+        path[depth] = node
+        if key < node_key:
+            went_left |= 1 << depth
             node = node.left
         else:
             node = node.right
+        depth += 1
 
     new_node = bstNode(key, value)
-    if not parent:
+    if self._min_key is None or key < self._min_key:
+        self._min_key = key
+    if self._max_key is None or key > self._max_key:
+        self._max_key = key
+    if not depth:
         self.root = new_node
-    elif key < parent.key:
-        parent.left = new_node
+        return
+    if went_left >> (depth - 1) & 1:
+        path[depth - 1].left = new_node
     else:
-        parent.right = new_node
-
-    # Rebalance while walking back up
-    child = new_node
-    while traversed:
-        cur = traversed.pop()
-        was_left_of_parent = None
-      
-        if traversed:
-            parent = traversed[-1]
-            was_left_of_parent = (parent.left is cur)
-        cur = self.__rebalance(cur)
-
-        if traversed:
-            if was_left_of_parent:
-                parent.left = cur
-            else:
-                parent.right = cur
-        else:
-            self.root = cur
+        path[depth - 1].right = new_node
 
-        child = cur
+    # Rebalance while walking back up, relinking each subtree into its parent
+    while depth:
+        depth -= 1
+        cur = _rebalance(path[depth])
+        if not depth:
+            self.root = cur
+        elif went_left >> (depth - 1) & 1:
+            path[depth - 1].left = cur
+        else:
+            path[depth - 1].right = cur
 
   def delete(self, key):
     """
@@ -165,15 +204,7 @@ class binarySearchTree:
 
 
   def getMaxKey(self):
-    def __max(node):
-      if not node.right:
-        return node.key
-      return __max(node.right)
-    return __max(self.root)
+    return self._max_key
 
   def getMinKey(self):
-    def __min(node):
-      if not node.left:
-        return node.key
-      return __min(node.left)
-    return __min(self.root)
\ No newline at end of file
+    return self._min_key
\ No newline at end of file
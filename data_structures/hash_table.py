@@ -1,10 +1,21 @@
 """
 Module for creating and modifying sorted hash tables.
 """
+from sortedcontainers import SortedList
+
 
 class HashTable:
   def __init__(self, keys, values):
-    self.table = {key: val for key, val in zip(keys, values)}
+    # Unbox NumPy inputs once in C rather than per element below
+    if hasattr(keys, 'tolist'):
+      keys = keys.tolist()
+    if hasattr(values, 'tolist'):
+      values = values.tolist()
+    self.table = dict(zip(keys, values))
+    # Sorted view of the keys for O(1) min/max
+    self._keys_sorted = SortedList(self.table)
+    # Key holding the largest value; None until computed or after it goes stale
+    self._max_val_key = None
 
   def search(self, key):
     return self.table.get(key)
@@ -13,23 +24,41 @@ class HashTable:
     if key in self.table:
       return
     self.table[key] = value
+    self._keys_sorted.add(key)
+    # Strictly greater: on ties the earlier-inserted key keeps winning
+    if self._max_val_key is not None and value > self.table[self._max_val_key]:
+      self._max_val_key = key
 
   def getMaxVal(self):
-    return max(self.table, key=self.table.get)
+    if self._max_val_key is None:
+      self._max_val_key = max(self.table, key=self.table.get)
+    return self._max_val_key
 
   def getMaxKey(self):
-    return max(self.table.keys())
+    return self._keys_sorted[-1]
 
   def getMinKey(self):
-    return min(self.table.keys())
+    return self._keys_sorted[0]
 
   def delete(self, key):
     del self.table[key]
+    self._keys_sorted.remove(key)
+    if key == self._max_val_key:
+      self._max_val_key = None
 
   def update(self, key, value):
     if key not in self.table:
       return
+    max_key = self._max_val_key
+    if max_key is not None:
+      max_val = self.table[max_key]
+      if key == max_key:
+        # A lowered maximum may have been overtaken; rescan on next read
+        if value < max_val:
+          self._max_val_key = None
+      elif value > max_val:
+        self._max_val_key = key
+      elif value == max_val:
+        # Tie order depends on insertion order, so let the rescan decide
+        self._max_val_key = None
     self.table[key] = value
-
-  
-    
@@ -10,6 +10,10 @@ class linkedList:
     """
 
     def __init__(self, keys, values):
+        if hasattr(keys, 'tolist'):
+            keys = keys.tolist()
+        if hasattr(values, 'tolist'):
+            values = values.tolist()
         self.head = None
         self.tail = None
         keys, values = zip(*sorted(zip(keys, values)))
@@ -22,6 +22,7 @@ class listNode:
   - Stores pointers to the next and previous nodes.
   - Prints the node in a readable format.
   """
+  __slots__ = ('key', 'value', 'next', 'prev')
 
   def __init__(self, key, value, next=None, prev=None):
     self.key = key
@@ -44,6 +45,7 @@ class bstNode:
   - Prints the node in a readable format.
   - Stores height for AVL tree balancing
   """
+  __slots__ = ('key', 'value', 'left', 'right', 'height')
 
   def __init__(self, key, value, left=None, right=None):
     self.key = key
@@ -68,11 +70,13 @@ class skipNode:
   - Prints the node in a readable format.
   - Allows for comparison operators to be used.
   """
+  __slots__ = ('key', 'value', 'forward')
 
-  def __init__(self, key, value, levels):
+  def __init__(self, key, value, levels, forward=None):
     self.key = key
     self.value = value
-    self.forward = [None] * levels
+    # Exact-size tower; callers splicing a node in pass it prebuilt
+    self.forward = forward if forward is not None else [None] * levels
 
   def __str__(self):
     return f'SkipNode({self.value})'
@@ -119,7 +123,7 @@ class ClusterNode:
   """
 
   def __init__(self, values, node_ids):
-    self.values = SortedList(zip(values))
+    self.values = SortedList(values)
     self.link = {'north': None, 'east': None, 'south': None, 'west': None}
     self.max_val = self.values[-1]
 
@@ -136,14 +140,15 @@ class IndexHash:
   def __init__(self, values=None, mod_val=0):
     if mod_val < 1:
       self.mod_val = self.__calc_mod(values)
-    self.mod_val = mod_val
+    else:
+      self.mod_val = mod_val
     self.table = {}
-    print(self.mod_val)
 
   def __calc_mod(self, values):
-    med = np.median(values)
-    avg = np.mean(values)
-    return round(math.sqrt(np.mean([med, avg])))
+    values = np.asarray(values)
+    med = float(np.median(values))
+    avg = float(values.mean())
+    return round(math.sqrt((med + avg) * 0.5))
 
 
 class IndexNode:
@@ -151,9 +156,10 @@ class IndexNode:
   Internal node of the LAT.
   Holds pointers to other IndexNodes or LeafNodes.
   """
+  __slots__ = ('pointers', 'radix', 'height', 'level')
 
   def __init__(self, radix, height, current_level):
-    self.pointers = {}
+    self.pointers = [None] * radix
     self.radix = radix
     self.height = height
     self.level = current_level
@@ -163,6 +169,7 @@ class LATLeafNode:
   """
   Final node of the LAT, where data is stored.
   """
+  __slots__ = ('data',)
 
   def __init__(self):
     self.data = {}
@@ -171,9 +178,54 @@ class LATLeafNode:
     self.data[key] = value
 
 
+# Largest radix whose nodes get a flat child list rather than a map
+RADIX_LIST_MAX = 32
+
+
+class RadixChildren(dict):
+  """ Sparse digit -> child map for large radixes; a missing digit reads as None. """
+  __slots__ = ()
+
+  def __missing__(self, digit):
+    return None
+
+
 class RadixTrieNode:
-  def __init__(self, key, value=None, children=None):
+  """
+  Radix Trie Node Class.
+  Features:
+  - Stores a digit key and an optional value.
+  - Children are a list of length radix indexed by digit when the radix is
+    small, otherwise a RadixChildren map; both read None for a missing digit.
+  """
+  __slots__ = ('key', 'value', 'children')
+
+  def __init__(self, key, value=None, radix=None):
     self.key = key
     self.value = value
-    self.children = {}
+    # No radix given: the sparse map, which accepts any digit
+    if radix is not None and radix <= RADIX_LIST_MAX:
+      self.children = [None] * radix
+    else:
+      self.children = RadixChildren()
+
+  def max_child(self):
+    """ Returns the (digit, child) pair with the largest digit, or None. """
+    children = self.children
+    if isinstance(children, list):
+      for digit in range(len(children) - 1, -1, -1):
+        if children[digit] is not None:
+          return digit, children[digit]
+      return None
+    if not children:
+      return None
+    digit = max(children)
+    return digit, children[digit]
+
+  def sorted_children(self):
+    """ Returns (digit, child) pairs in ascending digit order. """
+    children = self.children
+    if isinstance(children, list):
+      return [(d, c) for d, c in enumerate(children) if c is not None]
+    return sorted(children.items())
     
@@ -2,6 +2,34 @@ import numpy as np
 
 from data_structures.node_classes import RadixTrieNode
 
+def _digit_breaker(radix):
+    """
+    Returns a key -> digit list function specialised for the radix:
+    ASCII digits for radix 10, shift/mask for powers of two, and a
+    divmod chain otherwise. Keys <= 0 break to no digits.
+    """
+    if radix == 10:
+        def break_key(key):
+            return [c - 48 for c in str(key).encode()] if key > 0 else []
+    elif radix & (radix - 1) == 0:
+        shift = radix.bit_length() - 1
+        mask = radix - 1
+        def break_key(key):
+            if key <= 0:
+                return []
+            top = (key.bit_length() - 1) // shift * shift
+            return [(key >> s) & mask for s in range(top, -1, -shift)]
+    else:
+        def break_key(key):
+            stack = []
+            while key > 0:
+                key, digit = divmod(key, radix)
+                stack.append(digit)
+            stack.reverse()
+            return stack
+    return break_key
+
+
 class RadixTrie:
     """
     Radix Trie Class.
@@ -12,34 +40,34 @@ class RadixTrie:
     - Provides methods to get the maximum and minimum keys.
     """
     def __init__(self, keys, values, radix=None):
-        self.root = RadixTrieNode(0)
+        if hasattr(keys, 'tolist'):
+            keys = keys.tolist()
+        if hasattr(values, 'tolist'):
+            values = values.tolist()
         if len(keys) == 0:
             self.radix = radix or 2
+            self._break_key = _digit_breaker(self.radix)
+            self.root = RadixTrieNode(0, radix=self.radix)
             return
         keys, values = zip(*sorted(zip(keys, values)))
         
         self.radix = radix or int(np.sqrt(np.median(keys)))
+        self._break_key = _digit_breaker(self.radix)
+        self.root = RadixTrieNode(0, radix=self.radix)
         for k, v in zip(keys, values):
             self.add(k, v)
 
     
-    def _break_key(self, key):
-        stack = []
-        while key > 0:
-            stack.append(int(key % self.radix))
-            key //= self.radix
-        return stack[::-1]
-
-        
     def add(self, key, value):
         stack = self._break_key(key)
         node = self.root
+        radix = self.radix
 
-        for i in range(len(stack)):
-            k = stack[i]
-            if k not in node.children:
-                node.children[k] = RadixTrieNode(k)
-            node = node.children[k]
+        for k in stack:
+            children = node.children
+            node = children[k]
+            if node is None:
+                node = children[k] = RadixTrieNode(k, radix=radix)
         if node.value is not None:
             return
         node.value = value
@@ -50,9 +78,9 @@ class RadixTrie:
         node = self.root
 
         for k in stack:
-            if k not in node.children:
-                return None
             node = node.children[k]
+            if node is None:
+                return None
         
         return node.value
 
@@ -61,10 +89,12 @@ class RadixTrie:
         node = self.root
         max_key = 0
 
-        while node.children:
-            max_child = max(node.children.keys())
+        while True:
+            last = node.max_child()
+            if last is None:
+                break
+            max_child, node = last
             max_key = max_key * self.radix + max_child
-            node = node.children[max_child]
 
         return max_key
     
@@ -75,8 +105,8 @@ class RadixTrie:
             if node.value is not None:
                 return path
 
-            for k in sorted(node.children.keys()):
-                child_path = dfs(node.children[k], path * self.radix + k)
+            for k, child in node.sorted_children():
+                child_path = dfs(child, path * self.radix + k)
                 if child_path is not None:
                     return child_path
             return None
@@ -4,6 +4,7 @@ Module for creating and modifying skip lists.
 from data_structures.node_classes import skipNode
 import random
 import math
+from operator import itemgetter
 
 class SkipList:
   """
@@ -15,13 +16,25 @@ class SkipList:
   """
 
   def __init__(self, keys, values, max_levels=None):
+    if hasattr(keys, 'tolist'):
+      keys = keys.tolist()
+    if hasattr(values, 'tolist'):
+      values = values.tolist()
     if not max_levels:
       est = math.ceil(math.log(len(keys), 2))
       max_levels = max(1, min(32, est))
     self.max_levels = max_levels
     self.head = skipNode(float('-inf'), None, self.max_levels)
     self.lvl = 0
-    for key, val in zip(keys, values):
+    self._min_key = None
+    self._max_key = None
+    # Last node at each level, so keys above the max append without a walk
+    self._tail_path = [self.head] * self.max_levels
+    # Update path reused by every _search_helper call
+    self._update_buf = [self.head] * self.max_levels
+    # Stable on key only, so the first value given for a duplicate key wins;
+    # every insert then takes the _add_sorted fast path
+    for key, val in sorted(zip(keys, values), key=itemgetter(0)):
       self.add(key, val)
 
   def __str__(self):
@@ -38,29 +51,39 @@ class SkipList:
     return "\n".join(output) + ('\n')
     
 
-  def _newNode(self, key, value, levels):
-    node = skipNode(key, value, levels + 1)
+  def _newNode(self, key, value, levels, forward=None):
+    node = skipNode(key, value, levels + 1, forward)
     return node
 
-  def _randomLevel(self, p=0.5):
-    lvl = 0
-    while random.random() < p and lvl < self.max_levels - 1:
-      lvl += 1
-    return lvl
+  def _randomLevel(self):
+    """
+    Geometric level with p=0.5 from a single RNG call: the trailing zero
+    bits of a random word count the successful coin flips.
+    """
+    r = random.getrandbits(self.max_levels)
+    if not r:
+      return self.max_levels - 1
+    return min((r & -r).bit_length() - 1, self.max_levels - 1)
     
 
   def _search_helper(self, key):
     """
-    Traverses skip list and returns the previous node before target value and level 0
-    Also returns the list of nodes at each level that need to be updated.
+    Traverses skip list and returns the list of nodes at each level that need
+    to be updated, along with the level 0 successor (the first node with
+    key >= target, or None), which the final step has already loaded.
+    The list is the shared _update_buf, overwritten by the next call, so
+    callers must finish with it before searching again. Entries above
+    self.lvl are never written and stay pointing at head.
     """
     curr = self.head
-    update = [self.head] * self.max_levels
+    update = self._update_buf
     for i in range(self.lvl, -1, -1):
-      while curr.forward[i] and curr.forward[i].key < key:
-        curr = curr.forward[i]
+      nxt = curr.forward[i]
+      while nxt is not None and nxt.key < key:
+        curr = nxt
+        nxt = curr.forward[i]
       update[i] = curr
-    return update
+    return update, nxt
       
   
   def add(self, key, value):
@@ -68,16 +91,44 @@ class SkipList:
     Traverses skip list and inserts new node at appropriate position.
     Keeps track of nodes at each level that need to be updated.
     """
-    update = self._search_helper(key)
-    if update[0].forward[0] and update[0].forward[0].key == key:
+    if self._max_key is None or key > self._max_key:
+      self._add_sorted(key, value)
+      return
+    update, succ = self._search_helper(key)
+    if succ is not None and succ.key == key:
       return
     levels = self._randomLevel()
     self.lvl = max(self.lvl, levels)
-    new_node = self._newNode(key, value, levels)
-    
+    # Build the tower from the successors in one pass, then link it in
+    new_node = self._newNode(key, value, levels,
+                             [update[i].forward[i] for i in range(levels + 1)])
+    tail = self._tail_path
     for i in range(levels + 1):
-      new_node.forward[i] = update[i].forward[i]
       update[i].forward[i] = new_node
+      # A tower taller than the max node's becomes the tail above it
+      if tail[i] is update[i]:
+        tail[i] = new_node
+
+    if key < self._min_key:
+      self._min_key = key
+
+  def _add_sorted(self, key, value):
+    """
+    Appends a key larger than every stored key.
+    The tail path is exactly the update list such a key would need,
+    so no search is done.
+    """
+    levels = self._randomLevel()
+    self.lvl = max(self.lvl, levels)
+    new_node = self._newNode(key, value, levels)
+    tail = self._tail_path
+    for i in range(levels + 1):
+      tail[i].forward[i] = new_node
+      tail[i] = new_node
+
+    if self._min_key is None:
+      self._min_key = key
+    self._max_key = key
 
   
   def delete(self, key):
@@ -85,27 +136,41 @@ class SkipList:
     Traverses skip list and removes node with given value.
     Keeps track of nodes at each level that need to be updated.
     """
-    update = self._search_helper(key)
-    old_node = update[0].forward[0]
+    update, old_node = self._search_helper(key)
     
-    if not old_node or old_node.key != key:
+    if old_node is None or old_node.key != key:
       return
     for i in range(self.lvl + 1):
-      nxt = update[i].forward[i]
-      if nxt and nxt == old_node:
+      # Identity, not ==: skipNode equality compares values
+      if update[i].forward[i] is old_node:
         update[i].forward[i] = old_node.forward[i]
+        if self._tail_path[i] is old_node:
+          self._tail_path[i] = update[i]
       else:
         break
 
+    if key == self._min_key:
+      first = self.head.forward[0]
+      self._min_key = first.key if first is not None else None
+    if key == self._max_key:
+      self._max_key = self._findMaxKey()
+
   
   def search(self, key):
-    res = self._search_helper(key)
-    targ = res[0].forward[0]
-    if targ and targ.key == key:
-      return targ.value
+    # Same walk as _search_helper, without recording the update path
+    curr = self.head
+    nxt = None
+    for i in range(self.lvl, -1, -1):
+      nxt = curr.forward[i]
+      while nxt is not None and nxt.key < key:
+        curr = nxt
+        nxt = curr.forward[i]
+    if nxt is not None and nxt.key == key:
+      return nxt.value
     return None
 
-  def getMaxKey(self):
+  def _findMaxKey(self):
+    """ Walks to the last node; only needed after the max key is deleted. """
     curr = self.head
     lvl = self.lvl
     while lvl >= 0:
@@ -113,7 +178,10 @@ class SkipList:
         curr = curr.forward[lvl]
       else:
         lvl -= 1
-    return curr.key
+    return curr.key if curr is not self.head else None
+
+  def getMaxKey(self):
+    return self._max_key
 
   def getMinKey(self):
-    return self.head.forward[0].key
\ No newline at end of file
+    return self._min_key
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+Module for creating and modifying sorted maps.
+"""
+from operator import itemgetter
+from sortedcontainers import SortedKeyList
+
+
+class SortedMap:
+  """
+  Sorted Map Class.
+  Features:
+  - Keeps (key, value) pairs in ascending key order, like linkedList, but in
+    a sortedcontainers.SortedKeyList (a list of sorted sublists) rather
+    than a chain of nodes.
+  - Every lookup bisects the sorted keys; there is no hashing. Search and
+    delete are O(log n), and add is O(log n) plus a shift within one sublist.
+  - O(1) access to the minimum and maximum keys.
+  """
+
+  def __init__(self, keys, values):
+    if hasattr(keys, 'tolist'):
+      keys = keys.tolist()
+    if hasattr(values, 'tolist'):
+      values = values.tolist()
+    # Stable on key only, so the first value given for a duplicate key wins,
+    # as with repeated add() calls
+    pairs = []
+    for pair in sorted(zip(keys, values), key=itemgetter(0)):
+      if not pairs or pairs[-1][0] != pair[0]:
+        pairs.append(pair)
+    self._pairs = SortedKeyList(pairs, key=itemgetter(0))
+
+  def _find(self, key):
+    """ Returns the stored (key, value) pair for key, or None. """
+    return next(self._pairs.irange_key(key, key), None)
+
+  def search(self, key):
+    pair = self._find(key)
+    return pair[1] if pair is not None else None
+
+  def add(self, key, value):
+    if self._find(key) is None:
+      self._pairs.add((key, value))
+
+  def delete(self, key):
+    pair = self._find(key)
+    if pair is not None:
+      self._pairs.remove(pair)
+
+  def getMaxKey(self):
+    return self._pairs[-1][0] if self._pairs else None
+
+  def getMinKey(self):
+    return self._pairs[0][0] if self._pairs else None
@@ -10,13 +10,16 @@ class Queue:
   Features:
   - Enqueues a value or multiple values onto the queue (front or back).
   - Dequeues a value or multiple values off the queue (front or back).
-  - Allows for a max size to be set and updated.
+  - Allows for a max size to be set and updated. Enqueuing past it drops
+    entries from the other end, unless strict is set, in which case a
+    batch larger than max size raises ValueError.
   - Allows for queue to be rotated.
   - Serialize for frontend.
   """
 
-  def __init__(self, values, max_size=None):
+  def __init__(self, values, max_size=None, strict=False):
     self.max_size = max_size
+    self.strict = strict
     if max_size is not None:
       if max_size < len(values):
         raise ValueError("Initial values exceed max size")
@@ -27,16 +30,20 @@ class Queue:
   def __str__(self):
     return f'Queue({list(self.que)})'
 
-  def enqueueFront(self, values):
-    if self.max_size and isinstance(values,
-                                    list) and len(values) > self.max_size:
+  def __checkSize(self, values):
+    values = list(values)
+    if len(values) > self.max_size:
       raise ValueError("Enqueue values exceed max size")
+    return values
+
+  def enqueueFront(self, values):
+    if self.strict and self.max_size:
+      values = self.__checkSize(values)
     self.que.extend(values)
 
   def enqueueBack(self, values):
-    if self.max_size and isinstance(values,
-                                    list) and len(values) > self.max_size:
-      raise ValueError("Enqueue values exceed max size")
+    if self.strict and self.max_size:
+      values = self.__checkSize(values)
     self.que.extendleft(values)
 
   def dequeueFront(self, count=1):
@@ -1,6 +1,7 @@
 """
 Module for creating and modifying stacks.
 """
+from collections import deque
 
 
 class Stack:
@@ -14,20 +15,16 @@ class Stack:
   """
 
   def __init__(self, values=None):
-    if values is None:
-      values = []
-    self.stack = values
+    self.stack = deque(() if values is None else values)
 
   def __str__(self):
-    return f'Stack({self.stack})'
+    return f'Stack({list(self.stack)})'
 
   def push(self, value):
     self.stack.append(value)
 
   def pop(self):
-    if len(self.stack) == 0:
-      return None
-    return self.stack.pop()
+    return self.stack.pop() if self.stack else None
 
   def peek(self):
     if not self.stack:
@@ -35,4 +32,4 @@ class Stack:
     return self.stack[-1]
 
   def to_dict(self):
-    return {"type": "stack", "values": self.stack}
+    return {"type": "stack", "values": list(self.stack)}